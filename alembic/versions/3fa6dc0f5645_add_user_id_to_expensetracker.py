@@ -17,38 +17,38 @@ down_revision: Union[str, None] = '90185bbb703e'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Owner for expense trackers created before user accounts existed
+DEFAULT_USER = {
+    "username": "default_user",
+    "email": "default@example.com",
+    "hashed_password": "$2b$12$defaulthashedpasswordforexistingdata",
+}
+
 
 def upgrade() -> None:
     # Add user_id column to expensetracker table as nullable first
     op.add_column('expensetracker', sa.Column('user_id', sa.Integer(), nullable=True))
     
-    # Handle existing data
+    # Handle existing data: create the default user if trackers exist and it
+    # is missing, then assign it to unowned trackers in one UPDATE
     connection = op.get_bind()
-    
-    # Check if there are existing expense trackers
-    result = connection.execute(sa.text("SELECT COUNT(*) FROM expensetracker"))
-    count = result.scalar()
-    
-    if count > 0:
-        # Check if default user exists, if not create it
-        result = connection.execute(sa.text("SELECT id FROM users WHERE username = 'default_user'"))
-        default_user_id = result.fetchone()
-        
-        if default_user_id is None:
-            # Create a default user for existing data
-            connection.execute(sa.text("""
-                INSERT INTO users (username, email, hashed_password) 
-                VALUES ('default_user', 'default@example.com', '$2b$12$defaulthashedpasswordforexistingdata')
-            """))
-            
-            # Get the newly created default user ID
-            result = connection.execute(sa.text("SELECT id FROM users WHERE username = 'default_user'"))
-            default_user_id = result.scalar()
-        else:
-            default_user_id = default_user_id[0]
-        
-        # Update existing expense trackers with the default user
-        connection.execute(sa.text(f"UPDATE expensetracker SET user_id = {default_user_id} WHERE user_id IS NULL"))
+    connection.execute(
+        sa.text("""
+            INSERT INTO users (username, email, hashed_password)
+            SELECT :username, :email, :hashed_password
+            WHERE EXISTS (SELECT 1 FROM expensetracker)
+              AND NOT EXISTS (SELECT 1 FROM users WHERE username = :username)
+        """),
+        DEFAULT_USER,
+    )
+    connection.execute(
+        sa.text("""
+            UPDATE expensetracker
+            SET user_id = (SELECT id FROM users WHERE username = :username)
+            WHERE user_id IS NULL
+        """),
+        {"username": DEFAULT_USER["username"]},
+    )
     
     # Now make the column non-nullable
     op.alter_column('expensetracker', 'user_id', nullable=False)
@@ -5,8 +5,10 @@ Revises: 3fa6dc0f5645
 Create Date: 2025-09-20 09:31:58.328794
 
 """
-from typing import Sequence, Union
+import os
+import time
 import uuid
+from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
@@ -19,6 +21,45 @@ down_revision: Union[str, None] = '3fa6dc0f5645'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# (name, table, columns, unique) for the indexes on the new UUID columns
+UUID_INDEXES = [
+    ('ix_users_uuid_id', 'users', ['uuid_id'], True),
+    ('ix_expensetracker_uuid_id', 'expensetracker', ['uuid_id'], True),
+    ('ix_expensetracker_uuid_user_id', 'expensetracker', ['uuid_user_id'], False),
+    ('ix_expense_uuid_id', 'expense', ['uuid_id'], True),
+    ('ix_expense_uuid_tracker_id', 'expense', ['uuid_tracker_id'], False),
+]
+
+# Rows per executemany() batch for the Python-side backfill
+BACKFILL_BATCH_SIZE = 5000
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered (version 7) UUID, copied from app.models.
+
+    Migrations must not import application code, which keeps changing
+    after this revision is frozen.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+# Time-ordered (version 7) UUID generated per row on PostgreSQL: the 48-bit
+# unix-millisecond prefix is overlaid onto a random v4 UUID and the version
+# nibble is switched from 4 to 7. gen_random_uuid() is built in from PG 13.
+UUID7_SQL = """
+    encode(
+        set_bit(set_bit(
+            overlay(uuid_send(gen_random_uuid())
+                    placing substring(int8send(floor(extract(epoch from clock_timestamp()) * 1000)::bigint) from 3)
+                    from 1 for 6),
+            52, 1), 53, 1),
+        'hex')::uuid::text
+"""
+
 
 def upgrade() -> None:
     # Enable UUID extension for PostgreSQL (if using PostgreSQL)
@@ -38,44 +79,56 @@ def upgrade() -> None:
     op.add_column('expense', sa.Column('uuid_tracker_id', sa.String(36), nullable=True))
     
     # Generate UUIDs for existing records
-    # Users
-    users_result = connection.execute(sa.text("SELECT id FROM users"))
-    users = users_result.fetchall()
-    user_uuid_mapping = {}
-    
-    for user in users:
-        user_uuid = str(uuid.uuid4())
-        user_uuid_mapping[user[0]] = user_uuid
-        connection.execute(
-            sa.text("UPDATE users SET uuid_id = :uuid_id WHERE id = :id"),
-            {"uuid_id": user_uuid, "id": user[0]}
-        )
-    
-    # ExpenseTracker
-    trackers_result = connection.execute(sa.text("SELECT id, user_id FROM expensetracker"))
-    trackers = trackers_result.fetchall()
-    tracker_uuid_mapping = {}
-    
-    for tracker in trackers:
-        tracker_uuid = str(uuid.uuid4())
-        tracker_uuid_mapping[tracker[0]] = tracker_uuid
-        user_uuid = user_uuid_mapping.get(tracker[1])
-        connection.execute(
-            sa.text("UPDATE expensetracker SET uuid_id = :uuid_id, uuid_user_id = :uuid_user_id WHERE id = :id"),
-            {"uuid_id": tracker_uuid, "uuid_user_id": user_uuid, "id": tracker[0]}
-        )
-    
-    # Expenses
-    expenses_result = connection.execute(sa.text('SELECT id, "trackerId" FROM expense'))
-    expenses = expenses_result.fetchall()
-    
-    for expense in expenses:
-        expense_uuid = str(uuid.uuid4())
-        tracker_uuid = tracker_uuid_mapping.get(expense[1])
-        connection.execute(
-            sa.text("UPDATE expense SET uuid_id = :uuid_id, uuid_tracker_id = :uuid_tracker_id WHERE id = :id"),
-            {"uuid_id": expense_uuid, "uuid_tracker_id": tracker_uuid, "id": expense[0]}
-        )
+    if connection.dialect.name == "postgresql":
+        # Set-based backfill: UUIDs are generated server-side and the FK UUIDs
+        # are resolved with UPDATE ... FROM joins, so no rows travel through
+        # Python.
+        connection.execute(sa.text(
+            f"UPDATE users SET uuid_id = {UUID7_SQL} WHERE uuid_id IS NULL"
+        ))
+        connection.execute(sa.text(f"""
+            UPDATE expensetracker
+            SET uuid_id = {UUID7_SQL},
+                uuid_user_id = users.uuid_id
+            FROM users
+            WHERE expensetracker.user_id = users.id
+        """))
+        connection.execute(sa.text(f"""
+            UPDATE expense
+            SET uuid_id = {UUID7_SQL},
+                uuid_tracker_id = expensetracker.uuid_id
+            FROM expensetracker
+            WHERE expense."trackerId" = expensetracker.id
+        """))
+    else:
+        # Other backends (SQLite in development) generate the UUIDs in Python.
+        # Ids are streamed in BACKFILL_BATCH_SIZE partitions rather than
+        # fetched all at once, and each partition is one executemany().
+        for table in ("users", "expensetracker", "expense"):
+            select_ids = sa.text(f"SELECT id FROM {table}").execution_options(
+                stream_results=True, yield_per=BACKFILL_BATCH_SIZE
+            )
+            update = sa.text(f"UPDATE {table} SET uuid_id = :uuid_id WHERE id = :id")
+            for batch in connection.execute(select_ids).partitions():
+                connection.execute(
+                    update,
+                    [{"uuid_id": str(uuid7()), "id": row[0]} for row in batch]
+                )
+
+        # Resolve the UUID foreign keys with correlated subqueries
+        connection.execute(sa.text("""
+            UPDATE expensetracker
+            SET uuid_user_id = (
+                SELECT users.uuid_id FROM users WHERE users.id = expensetracker.user_id
+            )
+        """))
+        connection.execute(sa.text("""
+            UPDATE expense
+            SET uuid_tracker_id = (
+                SELECT expensetracker.uuid_id FROM expensetracker
+                WHERE expensetracker.id = expense."trackerId"
+            )
+        """))
     
     # Make UUID columns non-nullable after populating them
     op.alter_column('users', 'uuid_id', nullable=False)
@@ -85,11 +138,15 @@ def upgrade() -> None:
     op.alter_column('expense', 'uuid_tracker_id', nullable=False)
     
     # Add indexes for better performance
-    op.create_index('ix_users_uuid_id', 'users', ['uuid_id'], unique=True)
-    op.create_index('ix_expensetracker_uuid_id', 'expensetracker', ['uuid_id'], unique=True)
-    op.create_index('ix_expensetracker_uuid_user_id', 'expensetracker', ['uuid_user_id'])
-    op.create_index('ix_expense_uuid_id', 'expense', ['uuid_id'], unique=True)
-    op.create_index('ix_expense_uuid_tracker_id', 'expense', ['uuid_tracker_id'])
+    if connection.dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction, but it
+        # lets writers keep going while each index is built
+        with op.get_context().autocommit_block():
+            for name, table, columns, unique in UUID_INDEXES:
+                op.create_index(name, table, columns, unique=unique, postgresql_concurrently=True)
+    else:
+        for name, table, columns, unique in UUID_INDEXES:
+            op.create_index(name, table, columns, unique=unique)
 
 
 def downgrade() -> None:
@@ -17,6 +17,13 @@ down_revision: Union[str, None] = '449996f77b27'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# (constraint, table, column, referenced table) for the UUID foreign keys
+UUID_FOREIGN_KEYS = [
+    ('expensetracker_uuid_user_id_fkey', 'expensetracker', 'uuid_user_id', 'users'),
+    ('expense_uuid_tracker_id_fkey', 'expense', 'uuid_tracker_id', 'expensetracker'),
+    ('refresh_tokens_uuid_user_id_fkey', 'refresh_tokens', 'uuid_user_id', 'users'),
+]
+
 
 def upgrade() -> None:
     # Step 1: Drop all existing foreign key constraints that reference integer IDs
@@ -60,10 +67,18 @@ def upgrade() -> None:
     op.create_primary_key('expensetracker_pkey', 'expensetracker', ['uuid_id'])
     op.create_primary_key('expense_pkey', 'expense', ['uuid_id'])
     
-    # Step 7: Create new foreign key constraints using UUIDs only
-    op.create_foreign_key('expensetracker_uuid_user_id_fkey', 'expensetracker', 'users', ['uuid_user_id'], ['uuid_id'])
-    op.create_foreign_key('expense_uuid_tracker_id_fkey', 'expense', 'expensetracker', ['uuid_tracker_id'], ['uuid_id'])
-    op.create_foreign_key('refresh_tokens_uuid_user_id_fkey', 'refresh_tokens', 'users', ['uuid_user_id'], ['uuid_id'])
+    # Step 7: Create new foreign key constraints using UUIDs only.
+    # They are added NOT VALID (metadata-only, no scan of existing rows) and
+    # validated after the migration transaction commits: VALIDATE CONSTRAINT
+    # only takes a SHARE UPDATE EXCLUSIVE lock, so reads and writes continue.
+    for name, table, column, referred_table in UUID_FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {name} "
+            f"FOREIGN KEY ({column}) REFERENCES {referred_table} (uuid_id) NOT VALID"
+        )
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in UUID_FOREIGN_KEYS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
 
 
 def downgrade() -> None:
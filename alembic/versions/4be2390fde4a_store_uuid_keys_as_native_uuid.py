@@ -0,0 +1,92 @@
+"""store_uuid_keys_as_native_uuid
+
+Revision ID: 4be2390fde4a
+Revises: e8a4b9c2d7f1
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4be2390fde4a"
+down_revision: Union[str, None] = "e8a4b9c2d7f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# UUID key columns per table, referenced tables first
+UUID_COLUMNS = {
+    "users": ["uuid_id"],
+    "expensetracker": ["uuid_id", "uuid_user_id"],
+    "expense": ["uuid_id", "uuid_tracker_id"],
+}
+
+
+def _alter_uuid_columns(table: str, columns: list, type_: str, cast: str) -> None:
+    # One ALTER TABLE per table: PostgreSQL rewrites the table once for all
+    # of its columns instead of once per column
+    op.execute(
+        f"ALTER TABLE {table} "
+        + ", ".join(f"ALTER COLUMN {column} TYPE {type_} USING {column}::{cast}" for column in columns)
+    )
+
+
+def _drop_uuid_foreign_keys() -> None:
+    op.drop_constraint("expense_uuid_tracker_id_fkey", "expense", type_="foreignkey")
+    op.drop_constraint("expensetracker_uuid_user_id_fkey", "expensetracker", type_="foreignkey")
+
+
+def _create_uuid_foreign_keys() -> None:
+    op.create_foreign_key(
+        "expensetracker_uuid_user_id_fkey", "expensetracker", "users", ["uuid_user_id"], ["uuid_id"]
+    )
+    op.create_foreign_key(
+        "expense_uuid_tracker_id_fkey", "expense", "expensetracker", ["uuid_tracker_id"], ["uuid_id"]
+    )
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+
+    if connection.dialect.name == "postgresql":
+        # Native 16-byte uuid keys instead of 36-char text. FKs must be dropped
+        # while the referenced and referencing columns change type together.
+        # The type change is not in place: each table is rewritten (with its
+        # indexes) under an ACCESS EXCLUSIVE lock, blocking reads and writes
+        # for the duration, so run this in a maintenance window.
+        _drop_uuid_foreign_keys()
+        for table, columns in UUID_COLUMNS.items():
+            _alter_uuid_columns(table, columns, "uuid", "uuid")
+        _create_uuid_foreign_keys()
+    else:
+        # Other backends store sa.Uuid as CHAR(32) hex without hyphens
+        for table, columns in UUID_COLUMNS.items():
+            assignments = ", ".join(f"{column} = replace({column}, '-', '')" for column in columns)
+            op.execute(f"UPDATE {table} SET {assignments}")
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+
+    if connection.dialect.name == "postgresql":
+        # Rewrites each table once under ACCESS EXCLUSIVE, as in upgrade()
+        _drop_uuid_foreign_keys()
+        for table, columns in UUID_COLUMNS.items():
+            _alter_uuid_columns(table, columns, "varchar(36)", "text")
+        _create_uuid_foreign_keys()
+    else:
+        for table, columns in UUID_COLUMNS.items():
+            for column in columns:
+                op.execute(
+                    f"""
+                    UPDATE {table}
+                    SET {column} = substr({column}, 1, 8) || '-' || substr({column}, 9, 4) || '-'
+                        || substr({column}, 13, 4) || '-' || substr({column}, 17, 4) || '-'
+                        || substr({column}, 21, 12)
+                    WHERE length({column}) = 32
+                    """
+                )
@@ -0,0 +1,43 @@
+"""add_expense_tracker_date_index
+
+Revision ID: 6d3f8a1c2b9e
+Revises: 4be2390fde4a
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6d3f8a1c2b9e"
+down_revision: Union[str, None] = "4be2390fde4a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (uuid_tracker_id, date) serves the per-tracker lookups as well as the
+    # daily-expenses GROUP BY date / ORDER BY date DESC, so it replaces the
+    # single-column ix_expense_uuid_tracker_id.
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_expense_uuid_tracker_id_date",
+                "expense",
+                ["uuid_tracker_id", "date"],
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                "ix_expense_uuid_tracker_id", table_name="expense", postgresql_concurrently=True
+            )
+    else:
+        op.create_index("ix_expense_uuid_tracker_id_date", "expense", ["uuid_tracker_id", "date"])
+        op.drop_index("ix_expense_uuid_tracker_id", table_name="expense")
+
+
+def downgrade() -> None:
+    op.create_index("ix_expense_uuid_tracker_id", "expense", ["uuid_tracker_id"])
+    op.drop_index("ix_expense_uuid_tracker_id_date", table_name="expense")
@@ -17,6 +17,13 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Owner for expense trackers created before user accounts existed
+DEFAULT_USER = {
+    "username": "default_user",
+    "email": "default@example.com",
+    "hashed_password": "$2b$12$defaulthashedpasswordforexistingdata",
+}
+
 
 def upgrade() -> None:
     # Create users table
@@ -33,26 +40,25 @@ def upgrade() -> None:
     # Add user_id column to expensetracker table as nullable first
     op.add_column('expensetracker', sa.Column('user_id', sa.Integer(), nullable=True))
     
-    # Create a default user for existing expense trackers
+    # Create a default user for existing expense trackers and assign it to
+    # them: two parameterized, set-based statements (no-ops on an empty table)
     connection = op.get_bind()
-    
-    # Check if there are existing expense trackers
-    result = connection.execute(sa.text("SELECT COUNT(*) FROM expensetracker"))
-    count = result.scalar()
-    
-    if count > 0:
-        # Create a default user for existing data
-        connection.execute(sa.text("""
-            INSERT INTO users (username, email, hashed_password) 
-            VALUES ('default_user', 'default@example.com', '$2b$12$defaulthashedpasswordforexistingdata')
-        """))
-        
-        # Get the default user ID
-        result = connection.execute(sa.text("SELECT id FROM users WHERE username = 'default_user'"))
-        default_user_id = result.scalar()
-        
-        # Update existing expense trackers with the default user
-        connection.execute(sa.text(f"UPDATE expensetracker SET user_id = {default_user_id} WHERE user_id IS NULL"))
+    connection.execute(
+        sa.text("""
+            INSERT INTO users (username, email, hashed_password)
+            SELECT :username, :email, :hashed_password
+            WHERE EXISTS (SELECT 1 FROM expensetracker)
+        """),
+        DEFAULT_USER,
+    )
+    connection.execute(
+        sa.text("""
+            UPDATE expensetracker
+            SET user_id = (SELECT id FROM users WHERE username = :username)
+            WHERE user_id IS NULL
+        """),
+        {"username": DEFAULT_USER["username"]},
+    )
     
     # Now make the column non-nullable
     op.alter_column('expensetracker', 'user_id', nullable=False)
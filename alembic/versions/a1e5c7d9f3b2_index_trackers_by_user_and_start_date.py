@@ -0,0 +1,58 @@
+"""index_trackers_by_user_and_start_date
+
+Revision ID: a1e5c7d9f3b2
+Revises: 6d3f8a1c2b9e
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1e5c7d9f3b2"
+down_revision: Union[str, None] = "6d3f8a1c2b9e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (uuid_user_id, startDate) serves the tracker list, active-tracker and
+    # overlap queries (all filter by owner and order/range on startDate) and
+    # replaces the single-column ix_expensetracker_uuid_user_id.
+    # (uuid_tracker_id, created_at) serves the full-sync expense listing.
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_expensetracker_uuid_user_id_startdate",
+                "expensetracker",
+                ["uuid_user_id", "startDate"],
+                postgresql_concurrently=True,
+            )
+            op.create_index(
+                "ix_expense_uuid_tracker_id_created_at",
+                "expense",
+                ["uuid_tracker_id", "created_at"],
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                "ix_expensetracker_uuid_user_id",
+                table_name="expensetracker",
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index(
+            "ix_expensetracker_uuid_user_id_startdate", "expensetracker", ["uuid_user_id", "startDate"]
+        )
+        op.create_index(
+            "ix_expense_uuid_tracker_id_created_at", "expense", ["uuid_tracker_id", "created_at"]
+        )
+        op.drop_index("ix_expensetracker_uuid_user_id", table_name="expensetracker")
+
+
+def downgrade() -> None:
+    op.create_index("ix_expensetracker_uuid_user_id", "expensetracker", ["uuid_user_id"])
+    op.drop_index("ix_expense_uuid_tracker_id_created_at", table_name="expense")
+    op.drop_index("ix_expensetracker_uuid_user_id_startdate", table_name="expensetracker")
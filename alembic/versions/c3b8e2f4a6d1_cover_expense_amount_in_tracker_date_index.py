@@ -0,0 +1,49 @@
+"""cover_expense_amount_in_tracker_date_index
+
+Revision ID: c3b8e2f4a6d1
+Revises: a1e5c7d9f3b2
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3b8e2f4a6d1"
+down_revision: Union[str, None] = "a1e5c7d9f3b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # PostgreSQL only: carrying amount in the (uuid_tracker_id, date) index lets
+    # the stats and daily-total SUMs run as index-only scans. The covering index
+    # is built under a temporary name, then swapped in for the old one.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_expense_uuid_tracker_id_date_amount",
+            "expense",
+            ["uuid_tracker_id", "date"],
+            postgresql_include=["amount"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_expense_uuid_tracker_id_date", table_name="expense", postgresql_concurrently=True
+        )
+    op.execute(
+        "ALTER INDEX ix_expense_uuid_tracker_id_date_amount RENAME TO ix_expense_uuid_tracker_id_date"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_expense_uuid_tracker_id_date", table_name="expense")
+    op.create_index("ix_expense_uuid_tracker_id_date", "expense", ["uuid_tracker_id", "date"])
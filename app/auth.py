@@ -1,10 +1,15 @@
+import hashlib
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
+from cachetools import TTLCache
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -19,12 +24,37 @@ if not SECRET_KEY:
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 14400  # 10 days
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: argon2id for new hashes; existing bcrypt hashes still
+# verify and are upgraded to argon2 on the user's next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
+# Per-process cache of already validated bearer tokens, so repeat requests
+# with the same token skip the JWT decode and the user SELECT.
+# Maps blake2b(token) -> (uuid_id, username, email, exp).
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def clear_token_cache() -> None:
+    """Forget all cached token lookups."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
@@ -38,7 +68,10 @@ def get_password_hash(password: str) -> str:
 
 def get_user_by_username(db: Session, username: str) -> Optional[models.User]:
     """Get user by username from database."""
-    return db.query(models.User).filter(models.User.username == username).first()
+    # lambda_stmt caches the constructed statement; username is bound per call
+    return db.execute(
+        lambda_stmt(lambda: select(models.User).where(models.User.username == username))
+    ).scalars().first()
 
 
 def authenticate_user(db: Session, username: str, password: str) -> Optional[models.User]:
@@ -46,8 +79,13 @@ def authenticate_user(db: Session, username: str, password: str) -> Optional[mod
     user = get_user_by_username(db, username)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    verified, new_hash = pwd_context.verify_and_update(password, user.hashed_password)
+    if not verified:
         return None
+    if new_hash:
+        # Stored hash uses a deprecated scheme (bcrypt); replace it
+        user.hashed_password = new_hash
+        db.commit()
     return user
 
 
@@ -63,28 +101,46 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> models.User:
-    """Get current user from JWT token."""
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> models.User:
+    """Get current user from JWT token.
+
+    Deliberately a plain ``def``: the user lookup is a blocking SQLAlchemy
+    query, so FastAPI must run it on the threadpool, not the event loop.
+    """
+    cache_key = _token_cache_key(token)
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+    if cached is not None:
+        uuid_id, username, email, exp = cached
+        if exp > time.time():
+            # Detached user carrying only the fields handlers rely on
+            return models.User(uuid_id=uuid_id, username=username, email=email)
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(
+            token, SECRET_KEY, algorithms=[ALGORITHM], options={"require": ["exp", "sub"]}
+        )
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
         token_data = schemas.TokenData(username=username)
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise credentials_exception
     
     user = get_user_by_username(db, username=token_data.username)
     if user is None:
         raise credentials_exception
+
+    with _token_cache_lock:
+        _token_cache[cache_key] = (user.uuid_id, user.username, user.email, payload["exp"])
     return user
 
 
-async def get_current_active_user(current_user: models.User = Depends(get_current_user)) -> models.User:
+def get_current_active_user(current_user: models.User = Depends(get_current_user)) -> models.User:
     """Get current active user (for future use if you add user deactivation)."""
     return current_user
@@ -1,8 +1,11 @@
+import logging
 import os
 import re
+import time
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.ext.declarative import declarative_base
 
 # Load .env file only in development (when .env exists)
@@ -23,10 +26,74 @@ if DATABASE_URL.startswith("postgres://"):
     # Railway uses postgres:// but SQLAlchemy 2.0 needs postgresql://
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, pool_recycle=300)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine_options = {"pool_pre_ping": True, "pool_recycle": 300}
+if DATABASE_URL.startswith("postgresql"):
+    engine_options.update(
+        # Sized for FastAPI's worker threadpool; LIFO reuse keeps the hot
+        # connections warm and lets surplus idle ones be recycled. The pool is
+        # per process: workers x (size + overflow) must fit max_connections.
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        # Fail fast with an error instead of queueing requests indefinitely
+        pool_timeout=30,
+        pool_use_lifo=True,
+        # JIT compilation costs more than it saves on these short OLTP queries
+        connect_args={"options": "-c jit=off"},
+    )
+elif DATABASE_URL.startswith("sqlite"):
+    # Local development: pooled connections are shared across FastAPI's threadpool
+    engine_options.update(connect_args={"check_same_thread": False})
+
+# Statement echo is opt-in; rendering and logging every query is costly
+engine = create_engine(DATABASE_URL, echo=os.getenv("SQL_ECHO", "0") == "1", **engine_options)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # Applied once per pooled connection rather than per request
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+# Optional slow-query log: only statements slower than the threshold are logged
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "0"))
+if SLOW_QUERY_MS > 0:
+    slow_query_logger = logging.getLogger("app.database.slow_query")
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        if elapsed_ms >= SLOW_QUERY_MS:
+            slow_query_logger.warning("Slow query (%.1f ms): %s", elapsed_ms, statement)
+
+# expire_on_commit=False: every column value is generated in Python, so
+# objects stay valid after commit and handlers can return freshly inserted
+# rows without a follow-up SELECT (db.refresh).
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
+def warm_up_pool(connections: int) -> None:
+    """Open and release pooled connections so early requests skip connect latency.
+
+    Capped at pool_size: connections beyond it are overflow, which the pool
+    closes again on release, so warming them would be wasted.
+    """
+    if isinstance(engine.pool, QueuePool):
+        connections = min(connections, engine.pool.size())
+    else:
+        # Static/singleton/null pools hold at most one reusable connection
+        connections = min(connections, 1)
+    opened = [engine.connect() for _ in range(connections)]
+    for connection in opened:
+        connection.close()
+
 def get_db():
     db = SessionLocal()
     try:
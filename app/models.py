@@ -1,43 +1,67 @@
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Index, Uuid
 from sqlalchemy.orm import relationship
 from datetime import datetime
+import os
+import time
 import uuid
 
 from app.database import Base
 
 
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered (RFC 9562 version 7) UUID.
+
+    The 48-bit millisecond timestamp prefix keeps new primary keys
+    append-mostly in the B-tree indexes, unlike fully random uuid4 keys.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+
 class User(Base):
     __tablename__ = "users"
 
-    # UUID primary key
-    uuid_id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # UUID primary key (native uuid on PostgreSQL, CHAR(32) elsewhere)
+    uuid_id = Column(Uuid(as_uuid=False), primary_key=True, default=lambda: str(uuid7()))
     username = Column(String, unique=True, nullable=False, index=True)
     email = Column(String, unique=True, nullable=False, index=True)
     hashed_password = Column(String, nullable=False)
 
+    # Relationships stay lazy by default: eager-loading here would pull every
+    # tracker (and every expense) on each auth lookup and tracker listing.
+    # Endpoints that serialize children opt in with selectinload() per query.
     expense_trackers = relationship("ExpenseTracker", back_populates="user", foreign_keys="ExpenseTracker.uuid_user_id")
 
 class ExpenseTracker(Base):
     __tablename__ = "expensetracker"
 
-    # UUID primary key
-    uuid_id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # UUID primary key (native uuid on PostgreSQL, CHAR(32) elsewhere)
+    uuid_id = Column(Uuid(as_uuid=False), primary_key=True, default=lambda: str(uuid7()))
     startDate = Column(Date, nullable=False)
     endDate = Column(Date, nullable=False)
     budget = Column(Float, nullable=False)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    # UUID foreign key
-    uuid_user_id = Column(String(36), ForeignKey("users.uuid_id"), nullable=False)
+    # UUID foreign key (indexed together with startDate, see __table_args__)
+    uuid_user_id = Column(Uuid(as_uuid=False), ForeignKey("users.uuid_id"), nullable=False)
 
     expenses = relationship("Expense", back_populates="tracker", foreign_keys="Expense.uuid_tracker_id")
     user = relationship("User", back_populates="expense_trackers", foreign_keys=[uuid_user_id])
 
+    __table_args__ = (
+        # Tracker list, active-tracker and overlap queries: owner + startDate
+        Index("ix_expensetracker_uuid_user_id_startdate", "uuid_user_id", "startDate"),
+    )
+
 class Expense(Base):
     __tablename__ = "expense"
 
     # UUID primary key - unique constraint ensures idempotent creation
-    uuid_id = Column(String(36), primary_key=True, unique=True, default=lambda: str(uuid.uuid4()))
+    uuid_id = Column(Uuid(as_uuid=False), primary_key=True, unique=True, default=lambda: str(uuid7()))
     description = Column(String, nullable=False)
     amount = Column(Float, nullable=False)
     date = Column(Date, nullable=False)
@@ -45,7 +69,20 @@ class Expense(Base):
     occurred_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    # UUID foreign key
-    uuid_tracker_id = Column(String(36), ForeignKey("expensetracker.uuid_id"), nullable=False)
+    # UUID foreign key (indexed together with date, see __table_args__)
+    uuid_tracker_id = Column(Uuid(as_uuid=False), ForeignKey("expensetracker.uuid_id"), nullable=False)
+
+    tracker = relationship("ExpenseTracker", back_populates="expenses", foreign_keys=[uuid_tracker_id])
 
-    tracker = relationship("ExpenseTracker", back_populates="expenses", foreign_keys=[uuid_tracker_id]) 
+    __table_args__ = (
+        # Per-tracker lookups and the daily-expenses GROUP BY / ORDER BY date;
+        # amount is carried along so the SUMs are index-only scans on PostgreSQL
+        Index(
+            "ix_expense_uuid_tracker_id_date",
+            "uuid_tracker_id",
+            "date",
+            postgresql_include=["amount"],
+        ),
+        # Full-sync expense listing ordered by created_at
+        Index("ix_expense_uuid_tracker_id_created_at", "uuid_tracker_id", "created_at"),
+    )
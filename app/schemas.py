@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import List, Optional
 from datetime import date, datetime
 import datetime as dt
@@ -29,8 +29,7 @@ class UserCreate(UserBase):
 
 class User(UserBase):
     uuid_id: str
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class UserLogin(BaseModel):
     username: str
@@ -57,6 +56,12 @@ class ExpenseCreate(ExpenseBase):
     uuid_id: str  # Client-generated stable UUID for idempotent creation
     uuid_tracker_id: str
 
+    @field_validator("uuid_id")
+    @classmethod
+    def uuid_id_must_be_uuid(cls, value: str) -> str:
+        # Stored in a uuid column; normalised so retries match the stored key
+        return str(uuid.UUID(value))
+
 # --- Update Schemas ---
 class ExpenseUpdate(BaseModel):
     description: Optional[str] = None
@@ -80,8 +85,7 @@ class Expense(ExpenseBase):
     occurred_at: datetime
     created_at: datetime
     updated_at: datetime
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ExpenseTrackerBase(BaseModel):
     startDate: date
@@ -100,20 +104,18 @@ class ExpenseTrackerSummary(ExpenseTrackerBase):
     of how many expenses each tracker has accumulated.
     """
     uuid_id: str
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ExpenseTracker(ExpenseTrackerBase):
     uuid_id: str
     expenses: List[Expense] = []
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # --- Schemas with Relationships ---
 
 class ExpenseTrackerWithExpenses(ExpenseTracker):
-    expenses: List[Expense] = []
+    pass
 
 # --- Stats Schema ---
 
@@ -126,8 +128,7 @@ class ExpenseTrackerStats(BaseModel):
     average_expenditure_per_day: float
     total_expenditure: float
     todays_expenditure: float
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # --- Daily Expense Schemas ---
 
@@ -140,8 +141,7 @@ class DailyExpenseTransaction(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class DailyExpenseGroup(BaseModel):
     date: date
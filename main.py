@@ -1,13 +1,23 @@
-from fastapi import FastAPI, HTTPException, Response, status, Depends
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Request, Response, status, Depends
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from typing import List, Optional
 from datetime import timedelta, date, datetime
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import bindparam, case, delete, func, lambda_stmt, or_, select
+from sqlalchemy.orm import Session, raiseload, selectinload
 from sqlalchemy.exc import IntegrityError
 from collections import defaultdict
+import hashlib
+import uuid
+from pydantic import BaseModel, TypeAdapter
 from app.schemas import CategoryEnum
 
-from app.database import get_db
+from app.database import engine, get_db, warm_up_pool
 import app.models as models
 import app.schemas as schemas
 import app.auth as auth
@@ -16,7 +26,21 @@ import app.auth as auth
 # Tables are managed via Alembic migrations (`alembic upgrade head`).
 # For initial setup without Alembic, run: python init_db.py
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Optionally pre-open pooled DB connections before serving traffic
+    warmup_connections = int(os.getenv("DB_POOL_WARMUP", "0"))
+    if warmup_connections > 0:
+        await asyncio.to_thread(warm_up_pool, warmup_connections)
+    yield
+    # Close pooled connections cleanly instead of leaving them to process exit
+    engine.dispose()
+
+
+# Responses are rendered with orjson (Rust) instead of the stdlib json module
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+# Compress larger JSON bodies (expense lists, tracker details); small ones aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 def _find_overlapping_tracker(
@@ -39,33 +63,215 @@ def _find_overlapping_tracker(
     return query.order_by(models.ExpenseTracker.startDate.desc()).first()
 
 
+def _require_uuid(value: str, detail: str) -> str:
+    """Return value in canonical UUID form, or 404 if it cannot be a UUID.
+
+    UUID columns are native uuid on PostgreSQL, which rejects malformed
+    input with an error instead of simply not matching.
+    """
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        raise HTTPException(status_code=404, detail=detail)
+
+
+def _validate_expense_create(expense_in: schemas.ExpenseCreate) -> None:
+    """400 for a new expense that is not worth storing (shared by single and bulk create)."""
+    if expense_in.amount <= 0:
+        raise HTTPException(status_code=400, detail="Expense amount must be greater than 0")
+
+    if not expense_in.description or len(expense_in.description.strip()) == 0:
+        raise HTTPException(status_code=400, detail="Expense description cannot be empty")
+
+
+def _get_owned_tracker(
+    db: Session,
+    tracker_uuid_id: str,
+    user_uuid_id: str,
+    forbidden_detail: str = "Not authorized to access this tracker",
+) -> models.ExpenseTracker:
+    """Fetch a tracker owned by the user with a single owner-filtered query.
+
+    Only when that misses is a second, key-only lookup made to tell a
+    missing tracker (404) from another user's tracker (403).
+    """
+    # lambda_stmt: the statement is built once and cached, only the ids are bound per call
+    tracker = db.execute(
+        lambda_stmt(
+            lambda: select(models.ExpenseTracker).where(
+                models.ExpenseTracker.uuid_id == tracker_uuid_id,
+                models.ExpenseTracker.uuid_user_id == user_uuid_id,
+            )
+        )
+    ).scalars().first()
+    if tracker:
+        return tracker
+    _raise_tracker_not_found_or_forbidden(db, tracker_uuid_id, forbidden_detail)
+
+
+def _raise_tracker_not_found_or_forbidden(
+    db: Session,
+    tracker_uuid_id: str,
+    forbidden_detail: str = "Not authorized to access this tracker",
+):
+    """After an owner-filtered lookup missed: 404 if the tracker is missing, else 403."""
+    tracker_exists = db.query(models.ExpenseTracker.uuid_id).filter(
+        models.ExpenseTracker.uuid_id == tracker_uuid_id
+    ).first()
+    if not tracker_exists:
+        raise HTTPException(status_code=404, detail="Tracker not found")
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=forbidden_detail)
+
+
+def _get_expense_with_owner(db: Session, expense_uuid_id: str):
+    """Return (expense, owner uuid) in one joined query, or None if missing."""
+    return db.execute(
+        lambda_stmt(
+            lambda: select(models.Expense, models.ExpenseTracker.uuid_user_id)
+            .join(models.ExpenseTracker, models.Expense.uuid_tracker_id == models.ExpenseTracker.uuid_id)
+            .where(models.Expense.uuid_id == expense_uuid_id)
+        )
+    ).first()
+
+
+def _etag_response(request: Request, content) -> Response:
+    """Render content as JSON with an ETag, answering 304 when the client's copy matches."""
+    return _with_etag(request, ORJSONResponse(content))
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag (RFC 9110).
+
+    Handles "*", comma-separated lists and W/ prefixes on either side.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _with_etag(request: Request, response: Response) -> Response:
+    """Tag a rendered response, answering 304 when the client's copy matches.
+
+    The ETag is a hash of the rendered body, so any change to the data
+    (including expenses feeding the stats) produces a new tag. It is weak
+    because GZipMiddleware may re-encode the body after it is computed.
+    """
+    etag = f'W/"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    # private: per-user data; no-cache: always revalidate with the ETag
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+def _tracker_summary(tracker: models.ExpenseTracker) -> dict:
+    """Plain-dict form of schemas.ExpenseTrackerSummary for direct rendering."""
+    return {
+        "startDate": tracker.startDate,
+        "endDate": tracker.endDate,
+        "budget": tracker.budget,
+        "name": tracker.name,
+        "description": tracker.description,
+        "uuid_id": tracker.uuid_id,
+    }
+
+
+class PydanticResponse(JSONResponse):
+    """Render a pydantic model with its own Rust serializer (model_dump_json).
+
+    Skips FastAPI's response_model validation and jsonable_encoder pass for
+    models already built from trusted DB rows.
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode()
+
+
+def _expense_model(expense: models.Expense) -> schemas.Expense:
+    """Build the response schema from a trusted DB row without re-validating it."""
+    return schemas.Expense.model_construct(
+        uuid_id=expense.uuid_id,
+        uuid_tracker_id=expense.uuid_tracker_id,
+        description=expense.description,
+        amount=expense.amount,
+        date=expense.date,
+        category=CategoryEnum(expense.category),
+        occurred_at=expense.occurred_at,
+        created_at=expense.created_at,
+        updated_at=expense.updated_at,
+    )
+
+
+def _tracker_with_expenses_model(tracker: models.ExpenseTracker) -> schemas.ExpenseTrackerWithExpenses:
+    """Build the response schema from a trusted DB row without re-validating it."""
+    return schemas.ExpenseTrackerWithExpenses.model_construct(
+        uuid_id=tracker.uuid_id,
+        startDate=tracker.startDate,
+        endDate=tracker.endDate,
+        budget=tracker.budget,
+        name=tracker.name,
+        description=tracker.description,
+        expenses=[_expense_model(expense) for expense in tracker.expenses],
+    )
+
+
 # --- Categories Endpoint ---
 
+# Serializes whole expense lists in one pydantic-core call
+EXPENSE_LIST_ADAPTER = TypeAdapter(List[schemas.Expense])
+
+# List statements built once at import; requests only bind the owner/tracker id
+TRACKERS_FOR_USER = (
+    select(models.ExpenseTracker)
+    .where(models.ExpenseTracker.uuid_user_id == bindparam("user_uuid_id"))
+    .order_by(models.ExpenseTracker.startDate.desc())
+    # Summaries never touch relationships; fail loudly instead of N+1
+    .options(raiseload("*"))
+)
+EXPENSES_FOR_TRACKER = (
+    select(models.Expense)
+    .where(models.Expense.uuid_tracker_id == bindparam("tracker_uuid_id"))
+    .order_by(models.Expense.created_at.desc())
+)
+
+CATEGORY_VALUES = [category.value for category in CategoryEnum]
+
+
 @app.get("/categories", response_model=List[str])
-def get_categories():
+async def get_categories():
     """Return the list of predefined expense categories.
     
     No authentication required — the Android app calls this once
     to populate the category picker when creating/editing an expense.
+    No I/O happens here, so it runs on the event loop instead of the threadpool.
     """
-    return [category.value for category in CategoryEnum]
+    return CATEGORY_VALUES
 
 
 # --- Auth Endpoints ---
 
 @app.post("/register", response_model=schemas.User)
 def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
-    # Check if user already exists
-    db_user = auth.get_user_by_username(db, username=user.username)
-    if db_user:
+    # Check username and email in one query (at most one row can match each)
+    existing_users = (
+        db.query(models.User.username, models.User.email)
+        .filter(or_(models.User.username == user.username, models.User.email == user.email))
+        .limit(2)
+        .all()
+    )
+    if any(existing.username == user.username for existing in existing_users):
         raise HTTPException(
             status_code=400,
             detail="Username already registered"
         )
     
-    # Check if email already exists
-    db_user_email = db.query(models.User).filter(models.User.email == user.email).first()
-    if db_user_email:
+    if existing_users:
         raise HTTPException(
             status_code=400,
             detail="Email already registered"
@@ -80,7 +286,6 @@ def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
     )
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 
@@ -101,14 +306,14 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
 
 
 @app.get("/me", response_model=schemas.User)
-def get_current_user_info(current_user: models.User = Depends(auth.get_current_active_user)):
+async def get_current_user_info(current_user: models.User = Depends(auth.get_current_active_user)):
     return current_user
 
 
 # --- ExpenseTracker Endpoints ---
 
-@app.get("/trackers", response_model=List[schemas.ExpenseTrackerSummary])
-def get_trackers(current_user: models.User = Depends(auth.get_current_active_user), db: Session = Depends(get_db)):
+@app.get("/trackers", responses={200: {"model": List[schemas.ExpenseTrackerSummary]}})
+def get_trackers(request: Request, current_user: models.User = Depends(auth.get_current_active_user), db: Session = Depends(get_db)):
     """Return a lightweight summary list of the current user's trackers.
 
     Expenses are intentionally excluded — fetch them per-tracker via
@@ -117,15 +322,10 @@ def get_trackers(current_user: models.User = Depends(auth.get_current_active_use
     """
     try:
         # Query trackers for the current user using UUID
-        trackers = (
-            db.query(models.ExpenseTracker)
-            .filter(models.ExpenseTracker.uuid_user_id == current_user.uuid_id)
-            .order_by(models.ExpenseTracker.startDate.desc())
-            .all()
-        )
+        trackers = db.execute(TRACKERS_FOR_USER, {"user_uuid_id": current_user.uuid_id}).scalars().all()
         
-        # Return trackers (empty list if none found)
-        return trackers
+        # Return trackers (empty list if none found), rendered straight to orjson
+        return _etag_response(request, [_tracker_summary(tracker) for tracker in trackers])
         
     except Exception as e:
         raise HTTPException(
@@ -133,7 +333,7 @@ def get_trackers(current_user: models.User = Depends(auth.get_current_active_use
             detail="An error occurred while retrieving trackers. Please try again later."
         )
 
-@app.post("/trackers", response_model=schemas.ExpenseTracker)
+@app.post("/trackers", responses={200: {"model": schemas.ExpenseTracker}})
 def create_tracker(tracker: schemas.ExpenseTrackerCreate, current_user: models.User = Depends(auth.get_current_active_user), db: Session = Depends(get_db)):
     try:
         # Validate tracker data
@@ -160,18 +360,17 @@ def create_tracker(tracker: schemas.ExpenseTrackerCreate, current_user: models.U
         
         # Create tracker with UUID primary key
         tracker_data = tracker.model_dump()
-        # Remove any 'id' field if present - not needed for UUID primary key
-        tracker_data.pop('id', None)
         
         db_tracker = models.ExpenseTracker(
             **tracker_data, 
-            uuid_user_id=current_user.uuid_id
+            uuid_user_id=current_user.uuid_id,
+            # A new tracker has no expenses; avoids a lazy load when serializing
+            expenses=[],
         )
         
         db.add(db_tracker)
         db.commit()
-        db.refresh(db_tracker)
-        return db_tracker
+        return PydanticResponse(_tracker_with_expenses_model(db_tracker))
         
     except HTTPException:
         # Re-raise HTTP exceptions (these are already properly formatted)
@@ -205,6 +404,7 @@ def get_active_tracker(
             models.ExpenseTracker.endDate >= today,
         )
         .order_by(models.ExpenseTracker.startDate.desc())
+        .options(raiseload("*"))
         .first()
     )
 
@@ -213,32 +413,39 @@ def get_active_tracker(
 
     return active_tracker
 
-@app.get("/trackers/{uuid_id}", response_model=schemas.ExpenseTrackerWithExpenses)
-def get_tracker_details(uuid_id: str, current_user: models.User = Depends(auth.get_current_active_user), db: Session = Depends(get_db)):
-    # First check if tracker exists at all
+@app.get("/trackers/{uuid_id}", responses={200: {"model": schemas.ExpenseTrackerWithExpenses}})
+def get_tracker_details(uuid_id: str, request: Request, current_user: models.User = Depends(auth.get_current_active_user), db: Session = Depends(get_db)):
+    uuid_id = _require_uuid(uuid_id, "Tracker not found")
+    # Owner-filtered, so expenses are only selectin-loaded once access is granted
     tracker = (
         db.query(models.ExpenseTracker)
-        .filter(models.ExpenseTracker.uuid_id == uuid_id)
-        .options(selectinload(models.ExpenseTracker.expenses))
+        .filter(
+            models.ExpenseTracker.uuid_id == uuid_id,
+            models.ExpenseTracker.uuid_user_id == current_user.uuid_id,
+        )
+        .options(selectinload(models.ExpenseTracker.expenses), raiseload("*"))
         .first()
     )
     if not tracker:
-        raise HTTPException(status_code=404, detail="Tracker not found")
-    
-    # Then verify the tracker belongs to the current user
-    if tracker.uuid_user_id != current_user.uuid_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this tracker")
+        _raise_tracker_not_found_or_forbidden(db, uuid_id)
     
-    return tracker
+    return _with_etag(request, PydanticResponse(_tracker_with_expenses_model(tracker)))
 
-@app.patch("/trackers/{uuid_id}", response_model=schemas.ExpenseTracker)
+@app.patch("/trackers/{uuid_id}", responses={200: {"model": schemas.ExpenseTracker}})
 def update_tracker(uuid_id: str, tracker_update: schemas.ExpenseTrackerUpdate, current_user: models.User = Depends(auth.get_current_active_user), db: Session = Depends(get_db)):
     """Update an expense tracker (PATCH - only specified fields)"""
-    # Get the existing tracker
-    db_tracker = db.query(models.ExpenseTracker).filter(
-        models.ExpenseTracker.uuid_id == uuid_id,
-        models.ExpenseTracker.uuid_user_id == current_user.uuid_id
-    ).first()
+    uuid_id = _require_uuid(uuid_id, "Tracker not found")
+    # Owner-filtered, so expenses (part of the response) are only
+    # selectin-loaded once access is granted
+    db_tracker = (
+        db.query(models.ExpenseTracker)
+        .filter(
+            models.ExpenseTracker.uuid_id == uuid_id,
+            models.ExpenseTracker.uuid_user_id == current_user.uuid_id,
+        )
+        .options(selectinload(models.ExpenseTracker.expenses), raiseload("*"))
+        .first()
+    )
     
     if not db_tracker:
         raise HTTPException(status_code=404, detail="Tracker not found")
@@ -277,42 +484,50 @@ def update_tracker(uuid_id: str, tracker_update: schemas.ExpenseTrackerUpdate, c
         setattr(db_tracker, field, value)
     
     db.commit()
-    db.refresh(db_tracker)
-    return db_tracker
+    return PydanticResponse(_tracker_with_expenses_model(db_tracker))
 
-@app.get("/trackers/{uuid_id}/stats", response_model=schemas.ExpenseTrackerStats)
-def get_tracker_stats(uuid_id: str, current_user: models.User = Depends(auth.get_current_active_user), db: Session = Depends(get_db)):
-    # First check if tracker exists and belongs to the current user
+@app.get("/trackers/{uuid_id}/stats", responses={200: {"model": schemas.ExpenseTrackerStats}})
+def get_tracker_stats(uuid_id: str, request: Request, current_user: models.User = Depends(auth.get_current_active_user), db: Session = Depends(get_db)):
+    uuid_id = _require_uuid(uuid_id, "Tracker not found")
+    today = date.today()
+
+    # Tracker columns and both expenditure sums in one round trip; the outer
+    # join keeps trackers without expenses, and no expense rows are loaded.
+    # Owner-filtered, so nothing is summed for other users' trackers
     tracker = (
-        db.query(models.ExpenseTracker)
-        .filter(models.ExpenseTracker.uuid_id == uuid_id)
-        .options(selectinload(models.ExpenseTracker.expenses))
+        db.query(
+            models.ExpenseTracker.startDate,
+            models.ExpenseTracker.endDate,
+            models.ExpenseTracker.budget,
+            func.coalesce(func.sum(models.Expense.amount), 0).label("total_sum"),
+            func.coalesce(
+                func.sum(case((models.Expense.date == today, models.Expense.amount), else_=0)),
+                0,
+            ).label("todays_sum"),
+        )
+        .outerjoin(models.Expense, models.Expense.uuid_tracker_id == models.ExpenseTracker.uuid_id)
+        .filter(
+            models.ExpenseTracker.uuid_id == uuid_id,
+            models.ExpenseTracker.uuid_user_id == current_user.uuid_id,
+        )
+        .group_by(models.ExpenseTracker.uuid_id)
         .first()
     )
     if not tracker:
-        raise HTTPException(status_code=404, detail="Tracker not found")
-    
-    # Verify the tracker belongs to the current user
-    if tracker.uuid_user_id != current_user.uuid_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this tracker")
-    
-    # Calculate stats
-    today = date.today()
+        _raise_tracker_not_found_or_forbidden(db, uuid_id)
     
     # Calculate remaining days (0 if end date has passed)
     remaining_days = max(0, (tracker.endDate - today).days)+1
+    total_sum, todays_sum = tracker.total_sum, tracker.todays_sum
 
      # Today's expenditure
-    todays_expenditure = round(
-        sum(expense.amount for expense in tracker.expenses if expense.date == today),
-        2,
-    )
+    todays_expenditure = round(float(todays_sum), 2)
     
     # Calculate total period in days
     #total_period_days = (tracker.endDate - tracker.startDate).days + 1  # +1 to include both start and end dates
        
-    # Calculate total expenditure by summing all expenses (rounded to 2 decimal places)
-    total_expenditure = round(sum(expense.amount for expense in tracker.expenses), 2)
+    # Calculate total expenditure (rounded to 2 decimal places)
+    total_expenditure = round(float(total_sum), 2)
     
     # Calculate average expenditure per day so far (from startDate to today or endDate, whichever is earlier)
     period_end_for_avg = min(today, tracker.endDate)
@@ -326,20 +541,21 @@ def get_tracker_stats(uuid_id: str, current_user: models.User = Depends(auth.get
     target_expenditure_per_day = round((tracker.budget-total_expenditure) / remaining_days if remaining_days > 0 else 0, 2)
 
     
-    return schemas.ExpenseTrackerStats(
-        start_date=tracker.startDate,
-        end_date=tracker.endDate,
-        budget=round(tracker.budget, 2),
-        remaining_days=remaining_days,
-        target_expenditure_per_day=target_expenditure_per_day,
-        average_expenditure_per_day=average_expenditure_per_day,
-        total_expenditure=total_expenditure,
-        todays_expenditure=todays_expenditure,
-    )
+    # Rendered straight to orjson; the schema is only documented via responses=
+    return _etag_response(request, {
+        "start_date": tracker.startDate,
+        "end_date": tracker.endDate,
+        "budget": round(float(tracker.budget), 2),
+        "remaining_days": remaining_days,
+        "target_expenditure_per_day": float(target_expenditure_per_day),
+        "average_expenditure_per_day": float(average_expenditure_per_day),
+        "total_expenditure": float(total_expenditure),
+        "todays_expenditure": float(todays_expenditure),
+    })
 
 # --- Expense Endpoints ---
 
-@app.get("/trackers/{tracker_uuid_id}/expenses", response_model=List[schemas.Expense])
+@app.get("/trackers/{tracker_uuid_id}/expenses", responses={200: {"model": List[schemas.Expense]}})
 def get_expenses_for_tracker(
     tracker_uuid_id: str,
     limit: Optional[int] = None,
@@ -360,31 +576,26 @@ def get_expenses_for_tracker(
     For a compact UI preview grouped by day, use
     GET /trackers/{tracker_uuid_id}/daily-expenses instead.
     """
-    # First check if tracker exists at all
-    tracker = db.query(models.ExpenseTracker).filter(models.ExpenseTracker.uuid_id == tracker_uuid_id).first()
-    if not tracker:
-        raise HTTPException(status_code=404, detail="Tracker not found")
-
-    # Then verify the tracker belongs to the current user
-    if tracker.uuid_user_id != current_user.uuid_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this tracker")
+    # Tracker must exist (404) and belong to the current user (403)
+    tracker_uuid_id = _require_uuid(tracker_uuid_id, "Tracker not found")
+    _get_owned_tracker(db, tracker_uuid_id, current_user.uuid_id)
 
-    query = (
-        db.query(models.Expense)
-        .filter(models.Expense.uuid_tracker_id == tracker_uuid_id)
-        .order_by(models.Expense.created_at.desc())
-        .offset(offset)
-    )
+    stmt = EXPENSES_FOR_TRACKER.offset(offset)
 
     if limit is not None:
-        query = query.limit(limit)
+        stmt = stmt.limit(limit)
 
-    return query.all()
+    rows = db.execute(stmt, {"tracker_uuid_id": tracker_uuid_id}).scalars().all()
+    expenses = [_expense_model(expense) for expense in rows]
+    return Response(content=EXPENSE_LIST_ADAPTER.dump_json(expenses), media_type="application/json")
 
-@app.post("/expenses", response_model=schemas.Expense)
+@app.post(
+    "/expenses",
+    status_code=status.HTTP_201_CREATED,
+    responses={200: {"model": schemas.Expense}, 201: {"model": schemas.Expense}},
+)
 def add_expense(
     expense_in: schemas.ExpenseCreate,
-    response: Response,
     current_user: models.User = Depends(auth.get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -403,15 +614,27 @@ def add_expense(
     """
     # --- Authorization checks (must happen before any insert attempt) ---
     
-    # First check if tracker exists at all
-    tracker = db.query(models.ExpenseTracker).filter(
-        models.ExpenseTracker.uuid_id == expense_in.uuid_tracker_id
-    ).first()
-    if not tracker:
+    expense_in.uuid_tracker_id = _require_uuid(expense_in.uuid_tracker_id, "Tracker not found")
+
+    # One round trip answers both the tracker ownership and the idempotency
+    # questions: the tracker's owner and the owner of any expense already
+    # stored under this uuid_id (NULL when there is none)
+    tracker_owner_uuid_id, existing_owner_uuid_id = db.execute(
+        select(
+            select(models.ExpenseTracker.uuid_user_id)
+            .where(models.ExpenseTracker.uuid_id == expense_in.uuid_tracker_id)
+            .scalar_subquery(),
+            select(models.ExpenseTracker.uuid_user_id)
+            .join(models.Expense, models.Expense.uuid_tracker_id == models.ExpenseTracker.uuid_id)
+            .where(models.Expense.uuid_id == expense_in.uuid_id)
+            .scalar_subquery(),
+        )
+    ).one()
+
+    # Tracker must exist (404) and belong to the current user (403)
+    if tracker_owner_uuid_id is None:
         raise HTTPException(status_code=404, detail="Tracker not found")
-    
-    # Then verify the tracker belongs to the current user
-    if tracker.uuid_user_id != current_user.uuid_id:
+    if tracker_owner_uuid_id != current_user.uuid_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to add expenses to this tracker"
@@ -419,27 +642,14 @@ def add_expense(
     
     # --- Input validation ---
     
-    if expense_in.amount <= 0:
-        raise HTTPException(status_code=400, detail="Expense amount must be greater than 0")
-    
-    if not expense_in.description or len(expense_in.description.strip()) == 0:
-        raise HTTPException(status_code=400, detail="Expense description cannot be empty")
+    _validate_expense_create(expense_in)
     
     # --- Idempotency check: look for existing expense with same uuid_id ---
     
-    existing_expense = db.query(models.Expense).filter(
-        models.Expense.uuid_id == expense_in.uuid_id
-    ).first()
-    
-    if existing_expense:
+    if existing_owner_uuid_id is not None:
         # Verify the existing expense belongs to a tracker owned by this user
         # (prevents information leakage about other users' expense IDs)
-        existing_tracker = db.query(models.ExpenseTracker).filter(
-            models.ExpenseTracker.uuid_id == existing_expense.uuid_tracker_id,
-            models.ExpenseTracker.uuid_user_id == current_user.uuid_id
-        ).first()
-        
-        if not existing_tracker:
+        if existing_owner_uuid_id != current_user.uuid_id:
             # The uuid_id exists but belongs to another user's expense
             # Return 409 Conflict to indicate the ID is taken
             raise HTTPException(
@@ -448,17 +658,15 @@ def add_expense(
             )
         
         # Return existing expense with 200 OK (idempotent retry)
-        response.status_code = status.HTTP_200_OK
-        return existing_expense
+        return PydanticResponse(
+            _expense_model(db.get(models.Expense, expense_in.uuid_id)),
+            status_code=status.HTTP_200_OK,
+        )
     
     # --- Create new expense ---
     
     try:
         expense_data = expense_in.model_dump()
-        
-        # Remove any legacy fields if present
-        expense_data.pop('id', None)
-        expense_data.pop('trackerId', None)
         if expense_data.get("occurred_at") is None:
             expense_data["occurred_at"] = datetime.utcnow()
         
@@ -466,36 +674,27 @@ def add_expense(
         
         db.add(db_expense)
         db.commit()
-        db.refresh(db_expense)
         
         # New expense created successfully
-        response.status_code = status.HTTP_201_CREATED
-        return db_expense
+        return PydanticResponse(_expense_model(db_expense), status_code=status.HTTP_201_CREATED)
         
     except IntegrityError:
         # Race condition: another request inserted the same uuid_id between our
         # check and insert. Rollback and fetch the existing row.
         db.rollback()
         
-        existing_expense = db.query(models.Expense).filter(
-            models.Expense.uuid_id == expense_in.uuid_id
-        ).first()
+        existing = _get_expense_with_owner(db, expense_in.uuid_id)
         
-        if existing_expense:
+        if existing:
+            existing_expense, owner_uuid_id = existing
             # Verify ownership before returning
-            existing_tracker = db.query(models.ExpenseTracker).filter(
-                models.ExpenseTracker.uuid_id == existing_expense.uuid_tracker_id,
-                models.ExpenseTracker.uuid_user_id == current_user.uuid_id
-            ).first()
-            
-            if not existing_tracker:
+            if owner_uuid_id != current_user.uuid_id:
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail="Expense ID already exists"
                 )
             
-            response.status_code = status.HTTP_200_OK
-            return existing_expense
+            return PydanticResponse(_expense_model(existing_expense), status_code=status.HTTP_200_OK)
         
         # If we still can't find it, something unexpected happened
         raise HTTPException(
@@ -514,23 +713,149 @@ def add_expense(
             detail="Failed to create expense. Please check your data and try again."
         )
 
+# Upper bound on one bulk request: it runs in a single transaction
+MAX_BULK_EXPENSES = 500
+
+
+@app.post(
+    "/expenses/bulk",
+    status_code=status.HTTP_201_CREATED,
+    responses={200: {"model": List[schemas.Expense]}, 201: {"model": List[schemas.Expense]}},
+)
+def add_expenses_bulk(
+    expenses_in: List[schemas.ExpenseCreate],
+    current_user: models.User = Depends(auth.get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Create many expenses in one transaction (idempotent per `uuid_id`).
+
+    Meant for imports and offline sync: every item follows the same rules as
+    POST /expenses, and items whose `uuid_id` already exists for this user are
+    returned as stored instead of being inserted again.
+
+    Returns (the expenses are listed in request order):
+        - 201 Created: At least one expense was inserted
+        - 200 OK: Every expense already existed (retried batch)
+        - 400 / 403 / 404 / 409: As for POST /expenses; nothing is written
+        - 413 Payload Too Large: More than MAX_BULK_EXPENSES items
+        - 422 Unprocessable Entity: The same `uuid_id` appears twice in the batch
+    """
+    # --- Batch shape ---
+
+    if len(expenses_in) > MAX_BULK_EXPENSES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {MAX_BULK_EXPENSES} expenses per request"
+        )
+
+    # Two items with one uuid_id would otherwise be merged, silently dropping one
+    if len({expense_in.uuid_id for expense_in in expenses_in}) != len(expenses_in):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Duplicate expense uuid_id in batch"
+        )
+
+    # --- Authorization: all referenced trackers in one query ---
+
+    for expense_in in expenses_in:
+        expense_in.uuid_tracker_id = _require_uuid(expense_in.uuid_tracker_id, "Tracker not found")
+    tracker_ids = {expense_in.uuid_tracker_id for expense_in in expenses_in}
+    tracker_owners = dict(
+        db.query(models.ExpenseTracker.uuid_id, models.ExpenseTracker.uuid_user_id)
+        .filter(models.ExpenseTracker.uuid_id.in_(tracker_ids))
+        .all()
+    )
+    if len(tracker_owners) != len(tracker_ids):
+        raise HTTPException(status_code=404, detail="Tracker not found")
+    if any(owner_uuid_id != current_user.uuid_id for owner_uuid_id in tracker_owners.values()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to add expenses to this tracker"
+        )
+
+    # --- Input validation (after authorization, as in POST /expenses) ---
+
+    for expense_in in expenses_in:
+        _validate_expense_create(expense_in)
+
+    # --- Idempotency: existing expenses with the requested uuid_ids, one query ---
+
+    existing_expenses = {}
+    existing_rows = (
+        db.query(models.Expense, models.ExpenseTracker.uuid_user_id)
+        .join(models.ExpenseTracker, models.Expense.uuid_tracker_id == models.ExpenseTracker.uuid_id)
+        .filter(models.Expense.uuid_id.in_({expense_in.uuid_id for expense_in in expenses_in}))
+        .all()
+    )
+    for existing_expense, owner_uuid_id in existing_rows:
+        if owner_uuid_id != current_user.uuid_id:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Expense ID already exists"
+            )
+        existing_expenses[existing_expense.uuid_id] = existing_expense
+
+    # --- Create the new expenses in a single flush (batched INSERT) ---
+
+    now = datetime.utcnow()
+    expenses_by_uuid = dict(existing_expenses)
+    new_expenses = []
+    for expense_in in expenses_in:
+        if expense_in.uuid_id in expenses_by_uuid:
+            continue
+        expense_data = expense_in.model_dump()
+        if expense_data.get("occurred_at") is None:
+            expense_data["occurred_at"] = now
+        db_expense = models.Expense(**expense_data)
+        expenses_by_uuid[expense_in.uuid_id] = db_expense
+        new_expenses.append(db_expense)
+
+    try:
+        db.add_all(new_expenses)
+        db.commit()
+    except IntegrityError:
+        # Another request inserted one of these uuid_ids concurrently; a retry
+        # of the whole batch is idempotent and will pick the stored rows up
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Some expenses were created concurrently. Please retry."
+        )
+
+    expenses = [_expense_model(expenses_by_uuid[expense_in.uuid_id]) for expense_in in expenses_in]
+    return Response(
+        content=EXPENSE_LIST_ADAPTER.dump_json(expenses),
+        # Like POST /expenses: 200 when the whole batch was a retry
+        status_code=status.HTTP_201_CREATED if new_expenses else status.HTTP_200_OK,
+        media_type="application/json",
+    )
+
 @app.delete("/expenses/{uuid_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_expense(uuid_id: str, current_user: models.User = Depends(auth.get_current_active_user), db: Session = Depends(get_db)):
-    expense = db.query(models.Expense).filter(models.Expense.uuid_id == uuid_id).first()
-    if not expense:
-        raise HTTPException(status_code=404, detail="Expense not found")
-    
-    # Verify the expense belongs to a tracker owned by the current user
-    tracker = db.query(models.ExpenseTracker).filter(
-        models.ExpenseTracker.uuid_id == expense.uuid_tracker_id,
-        models.ExpenseTracker.uuid_user_id == current_user.uuid_id
-    ).first()
-    if not tracker:
+    uuid_id = _require_uuid(uuid_id, "Expense not found")
+    # Ownership is enforced by the DELETE itself: one statement, no ORM objects
+    result = db.execute(
+        delete(models.Expense)
+        .where(
+            models.Expense.uuid_id == uuid_id,
+            models.Expense.uuid_tracker_id.in_(
+                select(models.ExpenseTracker.uuid_id).where(
+                    models.ExpenseTracker.uuid_user_id == current_user.uuid_id
+                )
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+    if result.rowcount == 0:
+        expense_exists = db.query(models.Expense.uuid_id).filter(models.Expense.uuid_id == uuid_id).first()
+        if not expense_exists:
+            raise HTTPException(status_code=404, detail="Expense not found")
         # The expense exists but the current user does not own the associated tracker
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to delete this expense")
-    
-    db.delete(expense)
-    db.commit()
+
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 @app.patch("/expenses/{uuid_id}", response_model=schemas.Expense)
@@ -540,15 +865,13 @@ def update_expense(
     current_user: models.User = Depends(auth.get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    expense = db.query(models.Expense).filter(models.Expense.uuid_id == uuid_id).first()
-    if not expense:
+    uuid_id = _require_uuid(uuid_id, "Expense not found")
+    existing = _get_expense_with_owner(db, uuid_id)
+    if not existing:
         raise HTTPException(status_code=404, detail="Expense not found")
 
-    tracker = db.query(models.ExpenseTracker).filter(
-        models.ExpenseTracker.uuid_id == expense.uuid_tracker_id,
-        models.ExpenseTracker.uuid_user_id == current_user.uuid_id
-    ).first()
-    if not tracker:
+    expense, owner_uuid_id = existing
+    if owner_uuid_id != current_user.uuid_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to update this expense")
 
     update_data = expense_update.model_dump(exclude_unset=True)
@@ -577,12 +900,12 @@ def update_expense(
 
     expense.updated_at = datetime.utcnow()
     db.commit()
-    db.refresh(expense)
     return expense
 
-@app.get("/trackers/{tracker_uuid_id}/daily-expenses", response_model=schemas.DailyExpensesResponse)
+@app.get("/trackers/{tracker_uuid_id}/daily-expenses", responses={200: {"model": schemas.DailyExpensesResponse}})
 def get_daily_expenses(tracker_uuid_id: str, current_user: models.User = Depends(auth.get_current_active_user), db: Session = Depends(get_db)):
     """Get daily expense totals grouped by date for a specific tracker"""
+    tracker_uuid_id = _require_uuid(tracker_uuid_id, "Tracker not found")
     # First check if tracker exists and belongs to the current user
     tracker = db.query(models.ExpenseTracker).filter(
         models.ExpenseTracker.uuid_id == tracker_uuid_id,
@@ -592,38 +915,60 @@ def get_daily_expenses(tracker_uuid_id: str, current_user: models.User = Depends
     if not tracker:
         raise HTTPException(status_code=404, detail="Tracker not found")
     
-    # Get all expenses for this tracker, ordered by user-facing occurrence time.
-    expenses = (
-        db.query(models.Expense)
+    # The five most recent days with expenses and their totals, grouped in SQL
+    top_days = (
+        db.query(models.Expense.date, func.sum(models.Expense.amount))
         .filter(models.Expense.uuid_tracker_id == tracker_uuid_id)
-        .order_by(models.Expense.date.desc(), models.Expense.occurred_at.desc())
+        .group_by(models.Expense.date)
+        .order_by(models.Expense.date.desc())
+        .limit(5)
         .all()
     )
-    
-    # Group expenses by date using defaultdict
-    daily_groups = defaultdict(list)
-    for expense in expenses:
-        daily_groups[expense.date].append({
-            "uuid_id": expense.uuid_id,
-            "name": expense.description,
-            "amount": expense.amount,
-            "category": expense.category if expense.category else CategoryEnum.other.value,
-            "occurred_at": expense.occurred_at,
-            "created_at": expense.created_at,
-            "updated_at": expense.updated_at,
-        })
-    
-    # Create daily summaries, sort by date (most recent first), limit to 5 days, and round totals
+
+    # Only the transactions on those days are loaded, ordered by user-facing occurrence time
+    daily_groups = {expense_date: [] for expense_date, _ in top_days}
+    if daily_groups:
+        expense_rows = (
+            db.query(
+                models.Expense.uuid_id,
+                models.Expense.description,
+                models.Expense.amount,
+                models.Expense.date,
+                models.Expense.category,
+                models.Expense.occurred_at,
+                models.Expense.created_at,
+                models.Expense.updated_at,
+            )
+            .filter(
+                models.Expense.uuid_tracker_id == tracker_uuid_id,
+                models.Expense.date.in_(list(daily_groups)),
+            )
+            .order_by(models.Expense.occurred_at.desc())
+            .all()
+        )
+        for expense in expense_rows:
+            daily_groups[expense.date].append({
+                "uuid_id": expense.uuid_id,
+                "name": expense.description,
+                "amount": expense.amount,
+                "category": expense.category if expense.category else CategoryEnum.other.value,
+                "occurred_at": expense.occurred_at,
+                "created_at": expense.created_at,
+                "updated_at": expense.updated_at,
+            })
+
+    # Daily summaries, most recent first, with totals rounded once per day
     daily_expenses_list = [
         {
             "date": expense_date,
-            "total_amount": round(sum(transaction["amount"] for transaction in transactions), 2),
-            "transactions": transactions
+            "total_amount": round(float(total_amount), 2),
+            "transactions": daily_groups[expense_date],
         }
-        for expense_date, transactions in sorted(daily_groups.items(), reverse=True)
-    ][:5]
+        for expense_date, total_amount in top_days
+    ]
     
-    return schemas.DailyExpensesResponse(daily_expenses=daily_expenses_list)
+    # Rendered straight to orjson; the schema is only documented via responses=
+    return ORJSONResponse({"daily_expenses": daily_expenses_list})
 
 
 @app.get("/trackers/{tracker_uuid_id}/analytics/categories", response_model=schemas.CategoryAnalyticsResponse)
@@ -638,6 +983,7 @@ def get_category_analytics(
     category that has at least one expense. Categories with no expenses are omitted.
     """
     # Verify tracker exists and belongs to the current user
+    tracker_uuid_id = _require_uuid(tracker_uuid_id, "Tracker not found")
     tracker = db.query(models.ExpenseTracker).filter(
         models.ExpenseTracker.uuid_id == tracker_uuid_id,
         models.ExpenseTracker.uuid_user_id == current_user.uuid_id
@@ -14,9 +14,9 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.database import Base, get_db
+from app.database import Base, SessionLocal, get_db
 from app.models import User, ExpenseTracker, Expense
-from app.auth import get_password_hash, create_access_token
+from app.auth import get_password_hash, create_access_token, clear_token_cache
 from main import app
 
 
@@ -28,7 +28,8 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Same session settings as the app (notably expire_on_commit=False), only rebound
+TestingSessionLocal = sessionmaker(**{**SessionLocal.kw, "bind": engine})
 
 
 def override_get_db():
@@ -48,6 +49,8 @@ def db():
     yield db
     db.close()
     Base.metadata.drop_all(bind=engine)
+    # Identical tokens are minted for same-named users across tests
+    clear_token_cache()
 
 
 @pytest.fixture(scope="function")
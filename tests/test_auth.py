@@ -6,7 +6,8 @@ If these break, your app's security is compromised.
 """
 import pytest
 from datetime import timedelta
-from jose import jwt
+import jwt
+from passlib.hash import bcrypt
 
 from app.auth import (
     verify_password,
@@ -16,7 +17,9 @@ from app.auth import (
     get_user_by_username,
     SECRET_KEY,
     ALGORITHM,
+    _token_cache,
 )
+from app.models import User
 
 
 class TestPasswordHashing:
@@ -75,9 +78,8 @@ class TestJWTToken:
         assert "exp" in payload
 
     def test_invalid_token_raises_error(self):
-        """Invalid token should raise JWTError."""
-        from jose import JWTError
-        with pytest.raises(JWTError):
+        """Invalid token should raise InvalidTokenError."""
+        with pytest.raises(jwt.InvalidTokenError):
             jwt.decode("invalid.token.here", SECRET_KEY, algorithms=[ALGORITHM])
 
 
@@ -162,6 +164,28 @@ class TestAuthEndpoints:
         assert "access_token" in data
         assert data["token_type"] == "bearer"
 
+    def test_login_upgrades_bcrypt_hash_to_argon2(self, client, db):
+        """A legacy bcrypt hash should be replaced by argon2id on login."""
+        user = User(
+            username="legacyuser",
+            email="legacyuser@example.com",
+            hashed_password=bcrypt.hash("legacypassword123")
+        )
+        db.add(user)
+        db.commit()
+        credentials = {"username": "legacyuser", "password": "legacypassword123"}
+
+        response = client.post("/login", data=credentials)
+        assert response.status_code == 200
+
+        db.refresh(user)
+        assert user.hashed_password.startswith("$argon2id$")
+        assert verify_password("legacypassword123", user.hashed_password)
+
+        # The upgraded hash should keep working
+        response = client.post("/login", data=credentials)
+        assert response.status_code == 200
+
     def test_login_wrong_password(self, client, test_user):
         """Should reject wrong password."""
         response = client.post("/login", data={
@@ -187,6 +211,20 @@ class TestAuthEndpoints:
         assert data["username"] == "testuser"
         assert data["email"] == "testuser@example.com"
 
+    def test_get_me_repeat_request_uses_token_cache(self, client, db, test_user, auth_headers):
+        """Repeat requests with the same token should be served from the cache."""
+        first = client.get("/me", headers=auth_headers)
+        assert first.status_code == 200
+        assert len(_token_cache) == 1
+
+        # Without the cache the second lookup would miss and return 401
+        db.delete(test_user)
+        db.commit()
+
+        second = client.get("/me", headers=auth_headers)
+        assert second.status_code == 200
+        assert second.json() == first.json()
+
     def test_get_me_unauthenticated(self, client):
         """Should reject request without token."""
         response = client.get("/me")
@@ -5,9 +5,12 @@ These tests are CRITICAL. If authorization breaks, users can see/modify
 other users' financial data. This would be a serious security incident.
 """
 import pytest
+import re
 import uuid
 from datetime import date, timedelta
 
+from sqlalchemy import event
+
 
 class TestTrackerAuthorization:
     """Test that users can only access their own trackers."""
@@ -46,6 +49,29 @@ class TestTrackerAuthorization:
         # Returns 404 because the query filters by user_id
         assert response.status_code == 404
 
+    def test_update_other_users_tracker_loads_no_expenses(
+        self, client, db, tracker_with_expenses, second_user_auth_headers
+    ):
+        """A rejected update should not read the other user's expenses."""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.patch(
+                f"/trackers/{tracker_with_expenses.uuid_id}",
+                headers=second_user_auth_headers,
+                json={"name": "Hacked!"}
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 404
+        assert not [s for s in statements if re.search(r"\bFROM expense\b", s)]
+
     def test_cannot_view_other_users_tracker_stats(
         self, client, test_tracker, second_user_auth_headers
     ):
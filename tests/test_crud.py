@@ -369,3 +369,45 @@ class TestTrackerWithExpenses:
         data = response.json()
         assert "expenses" in data
         assert len(data["expenses"]) == 4  # We created 4 expenses in fixture
+
+    def test_tracker_detail_etag_not_modified(
+        self, client, tracker_with_expenses, test_expense, auth_headers
+    ):
+        """A matching If-None-Match should get 304 until the tracker changes."""
+        url = f"/trackers/{tracker_with_expenses.uuid_id}"
+        first = client.get(url, headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        cached = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        deleted = client.delete(f"/expenses/{test_expense.uuid_id}", headers=auth_headers)
+        assert deleted.status_code == 204
+
+        changed = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    def test_tracker_detail_etag_weak_comparison(
+        self, client, tracker_with_expenses, auth_headers
+    ):
+        """If-None-Match should use weak comparison, lists and "*"."""
+        url = f"/trackers/{tracker_with_expenses.uuid_id}"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+        assert etag.startswith('W/"')
+        opaque = etag.removeprefix("W/")
+
+        for if_none_match in (
+            opaque,
+            etag,
+            f'"stale", {etag}',
+            f'W/"stale",{opaque}',
+            "*",
+        ):
+            cached = client.get(url, headers={**auth_headers, "If-None-Match": if_none_match})
+            assert cached.status_code == 304, if_none_match
+
+        stale = client.get(url, headers={**auth_headers, "If-None-Match": 'W/"stale"'})
+        assert stale.status_code == 200
@@ -280,6 +280,152 @@ class TestIdempotentExpenseCreation:
         assert "Tracker not found" in response.json()["detail"]
 
 
+class TestBulkExpenseCreation:
+    """Test bulk expense creation for imports and offline sync."""
+
+    def _expense(self, tracker_uuid_id, description="Bulk expense", amount=10.00):
+        return {
+            "uuid_id": str(uuid.uuid4()),
+            "description": description,
+            "amount": amount,
+            "date": str(date.today()),
+            "uuid_tracker_id": tracker_uuid_id,
+        }
+
+    def test_bulk_create_inserts_all_rows_in_order(self, client, test_tracker, auth_headers, db):
+        """All expenses should be created and returned in request order."""
+        payload = [
+            self._expense(test_tracker.uuid_id, "Groceries", 40.00),
+            self._expense(test_tracker.uuid_id, "Bus", 2.50),
+        ]
+
+        response = client.post("/expenses/bulk", headers=auth_headers, json=payload)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert [e["uuid_id"] for e in data] == [e["uuid_id"] for e in payload]
+        assert data[0]["description"] == "Groceries"
+        count = db.query(Expense).filter(Expense.uuid_tracker_id == test_tracker.uuid_id).count()
+        assert count == 2
+
+    def test_bulk_retry_does_not_duplicate(self, client, test_tracker, auth_headers, db):
+        """Re-sending a batch should return the stored rows without duplicates."""
+        payload = [self._expense(test_tracker.uuid_id), self._expense(test_tracker.uuid_id)]
+
+        first = client.post("/expenses/bulk", headers=auth_headers, json=payload)
+        second = client.post("/expenses/bulk", headers=auth_headers, json=payload)
+
+        assert first.status_code == 201
+        assert second.status_code == 200  # pure retry, as for POST /expenses
+        assert [e["uuid_id"] for e in second.json()] == [e["uuid_id"] for e in first.json()]
+        count = db.query(Expense).filter(Expense.uuid_tracker_id == test_tracker.uuid_id).count()
+        assert count == 2
+
+    def test_bulk_tracker_ownership_enforced(
+        self, client, test_tracker, second_user_auth_headers, db
+    ):
+        """Nothing should be written when any tracker belongs to another user."""
+        payload = [self._expense(test_tracker.uuid_id)]
+
+        response = client.post("/expenses/bulk", headers=second_user_auth_headers, json=payload)
+
+        assert response.status_code == 403
+        assert "Not authorized" in response.json()["detail"]
+        assert db.query(Expense).count() == 0
+
+    def test_bulk_partial_retry_returns_201(self, client, test_tracker, auth_headers, db):
+        """A batch mixing stored and new expenses should insert only the new ones."""
+        stored = self._expense(test_tracker.uuid_id)
+        client.post("/expenses/bulk", headers=auth_headers, json=[stored])
+
+        response = client.post(
+            "/expenses/bulk", headers=auth_headers, json=[stored, self._expense(test_tracker.uuid_id)]
+        )
+
+        assert response.status_code == 201
+        count = db.query(Expense).filter(Expense.uuid_tracker_id == test_tracker.uuid_id).count()
+        assert count == 2
+
+    def test_bulk_duplicate_uuid_in_batch_returns_422(self, client, test_tracker, auth_headers, db):
+        """Two items sharing a uuid_id should reject the batch, not drop one of them."""
+        first = self._expense(test_tracker.uuid_id, "Groceries", 40.00)
+        second = self._expense(test_tracker.uuid_id, "Bus", 2.50)
+        second["uuid_id"] = first["uuid_id"]
+
+        response = client.post("/expenses/bulk", headers=auth_headers, json=[first, second])
+
+        assert response.status_code == 422
+        assert "Duplicate" in response.json()["detail"]
+        assert db.query(Expense).count() == 0
+
+    def test_bulk_authorizes_before_validating(
+        self, client, test_tracker, second_user_auth_headers, db
+    ):
+        """As for POST /expenses, another user's tracker is 403 even for invalid items."""
+        payload = [self._expense(test_tracker.uuid_id, description="   ")]
+
+        response = client.post("/expenses/bulk", headers=second_user_auth_headers, json=payload)
+
+        assert response.status_code == 403
+
+    def test_bulk_invalid_item_returns_400(self, client, test_tracker, auth_headers, db):
+        """One invalid item should reject the whole batch."""
+        payload = [self._expense(test_tracker.uuid_id), self._expense(test_tracker.uuid_id, amount=0)]
+
+        response = client.post("/expenses/bulk", headers=auth_headers, json=payload)
+
+        assert response.status_code == 400
+        assert "amount must be greater than 0" in response.json()["detail"]
+        assert db.query(Expense).count() == 0
+
+    def test_bulk_nonexistent_tracker_returns_404(self, client, test_tracker, auth_headers, db):
+        """Nothing should be written when any tracker does not exist."""
+        payload = [self._expense(test_tracker.uuid_id), self._expense(str(uuid.uuid4()))]
+
+        response = client.post("/expenses/bulk", headers=auth_headers, json=payload)
+
+        assert response.status_code == 404
+        assert "Tracker not found" in response.json()["detail"]
+        assert db.query(Expense).count() == 0
+
+    def test_bulk_expense_id_of_other_user_returns_409(
+        self, client, test_expense, second_user, second_user_auth_headers, db
+    ):
+        """An item reusing another user's expense uuid_id should reject the batch."""
+        from app.models import ExpenseTracker
+
+        second_tracker = ExpenseTracker(
+            name="Second User Tracker",
+            budget=500.00,
+            startDate=date.today(),
+            endDate=date.today(),
+            uuid_user_id=second_user.uuid_id,
+        )
+        db.add(second_tracker)
+        db.commit()
+
+        colliding = self._expense(second_tracker.uuid_id)
+        colliding["uuid_id"] = test_expense.uuid_id
+        payload = [self._expense(second_tracker.uuid_id), colliding]
+
+        response = client.post("/expenses/bulk", headers=second_user_auth_headers, json=payload)
+
+        assert response.status_code == 409
+        assert db.query(Expense).count() == 1
+        assert db.query(Expense).filter(Expense.uuid_tracker_id == second_tracker.uuid_id).count() == 0
+
+    def test_bulk_rejects_oversized_batch(self, client, test_tracker, auth_headers, db):
+        """Batches over the limit should be rejected before anything is written."""
+        from main import MAX_BULK_EXPENSES
+
+        payload = [self._expense(test_tracker.uuid_id) for _ in range(MAX_BULK_EXPENSES + 1)]
+
+        response = client.post("/expenses/bulk", headers=auth_headers, json=payload)
+
+        assert response.status_code == 413
+        assert db.query(Expense).count() == 0
+
+
 class TestConcurrentIdempotentCreation:
     """Test concurrent requests for idempotent expense creation."""
 
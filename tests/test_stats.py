@@ -5,6 +5,7 @@ These tests are IMPORTANT - they verify the financial calculations
 are correct. Wrong math = wrong budget guidance for users.
 """
 import pytest
+import uuid
 from datetime import date, datetime, timedelta
 
 from app.models import Expense, ExpenseTracker
@@ -97,6 +98,28 @@ class TestStatsCalculations:
         
         assert stats["budget"] == 1000.00
 
+    def test_stats_etag_not_modified(self, client, test_tracker, auth_headers):
+        """A matching If-None-Match should get 304 until the stats change."""
+        url = f"/trackers/{test_tracker.uuid_id}/stats"
+        first = client.get(url, headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        cached = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+
+        client.post("/expenses", json={
+            "uuid_id": str(uuid.uuid4()),
+            "uuid_tracker_id": test_tracker.uuid_id,
+            "description": "Coffee",
+            "amount": 4.50,
+            "date": date.today().isoformat(),
+        }, headers=auth_headers)
+
+        changed = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
 
 class TestStatsEdgeCases:
     """Test edge cases in statistics calculations."""
@@ -333,3 +333,57 @@ class TestSchemaValidation:
         )
         assert response.status_code == 422
 
+
+    def test_reject_malformed_expense_uuid(self, client, test_tracker, auth_headers):
+        """Should reject a client expense id that is not a UUID."""
+        response = client.post(
+            "/expenses",
+            headers=auth_headers,
+            json={
+                "uuid_id": "not-a-uuid",
+                "description": "Test expense",
+                "amount": 50,
+                "date": str(date.today()),
+                "uuid_tracker_id": test_tracker.uuid_id
+            }
+        )
+        assert response.status_code == 422
+
+
+class TestMalformedIds:
+    """Malformed ids must never reach the uuid columns."""
+
+    @pytest.mark.parametrize("method, path", [
+        ("get", "/trackers/not-a-uuid"),
+        ("patch", "/trackers/not-a-uuid"),
+        ("get", "/trackers/not-a-uuid/stats"),
+        ("get", "/trackers/not-a-uuid/expenses"),
+        ("get", "/trackers/not-a-uuid/daily-expenses"),
+        ("get", "/trackers/not-a-uuid/analytics/categories"),
+        ("delete", "/expenses/not-a-uuid"),
+        ("patch", "/expenses/not-a-uuid"),
+    ])
+    def test_malformed_path_id_returns_404(self, client, auth_headers, method, path):
+        """Should answer 404 for ids that cannot be UUIDs."""
+        kwargs = {"json": {}} if method == "patch" else {}
+        response = client.request(method, path, headers=auth_headers, **kwargs)
+        assert response.status_code == 404
+
+    def test_expense_uuid_is_normalised(self, client, test_tracker, auth_headers):
+        """An uppercase retry of the same UUID should hit the stored expense."""
+        expense_uuid = str(uuid.uuid4())
+        expense_data = {
+            "uuid_id": expense_uuid.upper(),
+            "description": "Test expense",
+            "amount": 50,
+            "date": str(date.today()),
+            "uuid_tracker_id": test_tracker.uuid_id.upper()
+        }
+        first = client.post("/expenses", headers=auth_headers, json=expense_data)
+        assert first.status_code == 201
+        assert first.json()["uuid_id"] == expense_uuid
+
+        retry = client.post(
+            "/expenses", headers=auth_headers, json={**expense_data, "uuid_id": expense_uuid}
+        )
+        assert retry.status_code == 200